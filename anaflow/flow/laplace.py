@@ -11,14 +11,18 @@ The following functions are provided
 """
 # pylint: disable=C0103
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-from scipy.special import kv, iv, gamma, erfcx
-from pentapy import solve
+from scipy.special import kv, iv, k0, k1, i0, i1, gamma, erfcx
+from pentapy.solver import penta_solver1
 from anaflow.tools.special import sph_surf
 
 __all__ = ["grf_laplace"]
 
+MIN_PARALLEL_SIZE = 64
+"""int: Number of laplace-points from which on threads are used."""
+
 
 def constant(s):
     """Constant pumping."""
@@ -56,6 +60,122 @@ def accruing(s, a=0):
 PUMP_COND = {0: constant, 1: periodic, 2: slug, 3: interval, 4: accruing}
 
 
+def get_bessel(nu):
+    """
+    Get the needed bessel functions for the GRF-model.
+
+    This provides the functions ``kv(nu, x)``, ``kv(nu - 1, x)``,
+    ``iv(nu, x)`` and ``iv(nu - 1, x)``, where the general purpose
+    routines are replaced by the specialized scipy versions or
+    closed forms for the orders arising from integer flow-dimensions.
+
+    Parameters
+    ----------
+    nu : :class:`float`
+        Order of the bessel functions given by ``1 - dim / 2``.
+
+    Returns
+    -------
+    :class:`tuple` of :any:`callable`
+        The functions ``(kv0, kv1, iv0, iv1)``.
+    """
+    if np.isclose(nu, 0):  # dim = 2
+
+        def kv1(x):
+            return k1(x)  # kv(-1, x) = kv(1, x)
+
+        def iv1(x):
+            return i1(x)  # iv(-1, x) = iv(1, x)
+
+        return k0, kv1, i0, iv1
+
+    if np.isclose(nu, 0.5):  # dim = 1
+
+        def kv0(x):
+            return np.sqrt(np.pi / (2 * x)) * np.exp(-x)
+
+        def iv0(x):
+            with np.errstate(over="ignore"):
+                return np.sqrt(2 / (np.pi * x)) * np.sinh(x)
+
+        def iv1(x):
+            with np.errstate(over="ignore"):
+                return np.sqrt(2 / (np.pi * x)) * np.cosh(x)
+
+        # kv is symmetric in nu: kv(-0.5, x) = kv(0.5, x)
+        return kv0, kv0, iv0, iv1
+
+    if np.isclose(nu, -0.5):  # dim = 3
+
+        def kv0(x):
+            return np.sqrt(np.pi / (2 * x)) * np.exp(-x)
+
+        def kv1(x):
+            return np.sqrt(np.pi / (2 * x)) * np.exp(-x) * (1.0 + 1.0 / x)
+
+        def iv0(x):
+            with np.errstate(over="ignore"):
+                return np.sqrt(2 / (np.pi * x)) * np.cosh(x)
+
+        def iv1(x):
+            # cosh * (tanh - 1/x) stays inf (not nan) for large arguments
+            with np.errstate(over="ignore"):
+                return (
+                    np.sqrt(2 / (np.pi * x))
+                    * np.cosh(x)
+                    * (np.tanh(x) - 1.0 / x)
+                )
+
+        return kv0, kv1, iv0, iv1
+
+    # fractured dimension -> general purpose routines
+    def kv0(x):
+        return kv(nu, x)
+
+    def kv1(x):
+        return kv(nu - 1, x)
+
+    def iv0(x):
+        return iv(nu, x)
+
+    def iv1(x):
+        return iv(nu - 1, x)
+
+    return kv0, kv1, iv0, iv1
+
+
+def _solve_4x4(mb, v0):
+    """
+    Unrolled solve of a 4x4 banded system with the RHS ``(v0, 0, 0, 0)``.
+
+    The matrix is given as the column-wise flattend band ``mb`` and the
+    elimination uses the same no-pivot scheme as PTRANS-I, so a zero
+    pivot yields non-finite coefficients that get erased downstream.
+    """
+    # dense entries of the 4x4 system (column-wise band layout)
+    a00, a01, a02 = mb[2, 0], mb[1, 1], mb[0, 2]
+    a10, a11, a12, a13 = mb[3, 0], mb[2, 1], mb[1, 2], mb[0, 3]
+    a20, a21, a22, a23 = mb[4, 0], mb[3, 1], mb[2, 2], mb[1, 3]
+    a31, a32, a33 = mb[4, 1], mb[3, 2], mb[2, 3]
+    # forward elimination
+    fac = a10 / a00
+    a11, a12, r1 = a11 - fac * a01, a12 - fac * a02, -fac * v0
+    fac = a20 / a00
+    a21, a22, r2 = a21 - fac * a01, a22 - fac * a02, -fac * v0
+    fac = a21 / a11
+    a22, a23, r2 = a22 - fac * a12, a23 - fac * a13, r2 - fac * r1
+    fac = a31 / a11
+    a32, a33, r3 = a32 - fac * a12, a33 - fac * a13, -fac * r1
+    fac = a32 / a22
+    a33, r3 = a33 - fac * a23, r3 - fac * r2
+    # back substitution
+    x3 = r3 / a33
+    x2 = (r2 - a23 * x3) / a22
+    x1 = (r1 - a12 * x2 - a13 * x3) / a11
+    x0 = (v0 - a01 * x1 - a02 * x2) / a00
+    return x0, x1, x2, x3
+
+
 def grf_laplace(
     s,
     rad=None,
@@ -138,6 +258,8 @@ def grf_laplace(
     dim = float(dim)
     nu = 1.0 - dim / 2.0
     nu1 = nu - 1
+    # get the fitting bessel functions for the given order
+    kv0, kv1, iv0, iv1 = get_bessel(nu)
     # the lateral extend is a bit subtle in fractured dimension
     lat_ext = float(lat_ext)
     rate = float(rate)
@@ -167,6 +289,10 @@ def grf_laplace(
 
     # initialize the result
     res = np.zeros(s.shape + rad.shape)
+    # pre-calculate the radii powers and the gamma factors (rwell=0 case)
+    rad_nu = rad ** nu
+    gam_fac = -gamma(1 - nu)
+    gam_fac2 = 2.0 / gamma(nu)
     # the first sqrt of the diffusivity values
     diff_sr0 = np.sqrt(S_part[0] / K_part[0])
     # set the general pumping-condtion depending on the well-radius
@@ -174,45 +300,51 @@ def grf_laplace(
         Qs = -(s ** (-0.5)) / diff_sr0 * R_part[0] ** nu1 * cond(s, **cond_kw)
     else:
         Qs = -((2 / diff_sr0) ** nu) * s ** (-nu / 2) * cond(s, **cond_kw)
+    # scale to the pumpingrate upfront: the coefficients are linear in Qs,
+    # which saves a final scaling pass over the whole result
+    scale = rate / (K_well * sph_surf(dim) * lat_ext ** (3.0 - dim))
+    Qs *= scale
 
     # if there is a homgeneouse aquifer, compute the result by hand
     if parts == 1:
-        # initialize the equation system
-        V = np.zeros(2, dtype=float)
-        M = np.array([[-gamma(1 - nu), 2.0 / gamma(nu)], [0, 1]])
-
-        for si, se in enumerate(s):
-            Cs = np.sqrt(se) * diff_sr0
-            # set the pumping-condition at the well
-            V[0] = Qs[si]
-            # incorporate the boundary-conditions
-            if R_part[0] > 0.0:
-                M[0, :] = [-kv(nu1, Cs * R_part[0]), iv(nu1, Cs * R_part[0])]
-            if R_part[-1] < np.inf:
-                M[1, :] = [kv(nu, Cs * R_part[-1]), iv(nu, Cs * R_part[-1])]
-            else:
-                M[0, 1] = 0  # Bs is 0 in this case either way
-            # solve the equation system
-            As, Bs = np.linalg.solve(M, V)
-
-            # calculate the head
-            for ri, re in enumerate(rad):
-                if re < R_part[-1]:
-                    res[si, ri] = re ** nu * (
-                        As * kv(nu, Cs * re) + Bs * iv(nu, Cs * re)
-                    )
+        # initialize the (2x2) equation systems for all laplace-points
+        Cs = np.sqrt(s) * diff_sr0
+        M = np.empty(s.shape + (2, 2))
+        V = np.zeros(s.shape + (2, 1))
+        M[:, 0, 0] = gam_fac
+        M[:, 0, 1] = gam_fac2
+        M[:, 1, 0] = 0.0
+        M[:, 1, 1] = 1.0
+        V[:, 0, 0] = Qs
+        # incorporate the boundary-conditions
+        if R_part[0] > 0.0:
+            M[:, 0, 0] = -kv1(Cs * R_part[0])
+            M[:, 0, 1] = iv1(Cs * R_part[0])
+        if R_part[-1] < np.inf:
+            M[:, 1, 0] = kv0(Cs * R_part[-1])
+            M[:, 1, 1] = iv0(Cs * R_part[-1])
+        else:
+            M[:, 0, 1] = 0.0  # Bs is 0 in this case either way
+        # solve all 2x2 systems with one batched LAPACK call
+        # (pivoting keeps the finite limit if iv0 overflows at the boundary)
+        X = np.linalg.solve(M, V)
+        As, Bs = X[:, 0, 0], X[:, 1, 0]
+
+        # calculate the head inside the domain
+        rad_msk = rad < R_part[-1]
+        arg = Cs[:, None] * rad[None, rad_msk]
+        res[:, rad_msk] = rad_nu[rad_msk] * (
+            As[:, None] * kv0(arg) + Bs[:, None] * iv0(arg)
+        )
 
     # if there is more than one partition, create an equation system
     else:
-        # initialize LHS and RHS for the linear equation system
-        # Mb is the banded matrix for the Eq-System
-        V = np.zeros(2 * parts)
-        Mb = np.zeros((5, 2 * parts))
-        X = np.zeros(2 * parts)
-        # set the standard boundary conditions for rwell=0.0 and rinf=np.inf
-        Mb[2, 0] = -gamma(1 - nu)
-        Mb[1, 1] = 2.0 / gamma(nu)
-        Mb[2, -1] = 1.0
+        # template for the banded matrix of the Eq-System with the
+        # standard boundary conditions for rwell=0.0 and rinf=np.inf
+        Mb_temp = np.zeros((5, 2 * parts))
+        Mb_temp[2, 0] = gam_fac
+        Mb_temp[1, 1] = gam_fac2
+        Mb_temp[2, -1] = 1.0
 
         # calculate the consecutive fractions of the conductivities
         Kfrac = K_part[:-1] / K_part[1:]
@@ -222,39 +354,67 @@ def grf_laplace(
         tmp = Kfrac * difsr[:-1] / difsr[1:]
         # match the radii to the different disks
         pos = np.searchsorted(R_part, rad) - 1
-
-        # iterate over the laplace-variable
-        for si, se in enumerate(s):
-            Cs = np.sqrt(se) * difsr
+        # coefficient indices and argument-scales matching the radii
+        idx_k = 2 * pos
+        idx_i = idx_k + 1
+        difsr_rad = difsr[pos] * rad
+        # the coefficients carry the pumpingrate scaling, so the
+        # cut-off precision is scaled alongside to keep its meaning
+        cut_off = cut_off_prec * abs(scale)
+
+        # evaluate the needed bessel-functions for all laplace-points at once
+        # Cs_all[si, i] is the argument-scale of disk i at laplace-point si
+        sqrt_s = np.sqrt(s)
+        Cs_all = sqrt_s[:, None] * difsr[None, :]
+        # interface radii seen from the inner disk (i) and the outer disk
+        # (i+1), stacked so each bessel-function needs only a single call
+        args = np.concatenate(
+            (Cs_all[:, :-1] * R_part[None, 1:-1],
+             Cs_all[:, 1:] * R_part[None, 1:-1]),
+            axis=1,
+        )
+        kv0_in, kv0_out = np.split(kv0(args), 2, axis=1)
+        kv1_in, kv1_out = np.split(kv1(args), 2, axis=1)
+        iv0_in, iv0_out = np.split(iv0(args), 2, axis=1)
+        iv1_in, iv1_out = np.split(iv1(args), 2, axis=1)
+        # boundary terms at the well-radius and the outer boundary
+        if R_part[0] > 0.0:
+            kv1_well = kv1(Cs_all[:, 0] * R_part[0])
+            iv1_well = iv1(Cs_all[:, 0] * R_part[0])
+        if R_part[-1] < np.inf:
+            kv0_bound = kv0(Cs_all[:, -1] * R_part[-1])
+            iv0_bound = iv0(Cs_all[:, -1] * R_part[-1])
+
+        def solve_one(si):
+            """Assemble and solve the system for a single laplace-point."""
+            # LHS, RHS and coefficients get own buffers per call,
+            # so the laplace-points can be processed in parallel
+            V = np.zeros(2 * parts)
+            Mb = Mb_temp.copy()
+            X = np.zeros(2 * parts)
 
             # set the pumping-condition at the well
             # --> implement other pumping conditions
             V[0] = Qs[si]
 
             # generate the equation system as banded matrix
-            for i in range(parts - 1):
-                Mb[0, 2 * i + 3] = -iv(nu, Cs[i + 1] * R_part[i + 1])
-                Mb[1, 2 * i + 2 : 2 * i + 4] = [
-                    -kv(nu, Cs[i + 1] * R_part[i + 1]),
-                    -iv(nu1, Cs[i + 1] * R_part[i + 1]),
-                ]
-                Mb[2, 2 * i + 1 : 2 * i + 3] = [
-                    iv(nu, Cs[i] * R_part[i + 1]),
-                    kv(nu1, Cs[i + 1] * R_part[i + 1]),
-                ]
-                Mb[3, 2 * i : 2 * i + 2] = [
-                    kv(nu, Cs[i] * R_part[i + 1]),
-                    tmp[i] * iv(nu1, Cs[i] * R_part[i + 1]),
-                ]
-                Mb[4, 2 * i] = -tmp[i] * kv(nu1, Cs[i] * R_part[i + 1])
+            # from the pre-evaluated bessel-functions
+            Mb[0, 3::2] = -iv0_out[si]
+            Mb[1, 2::2] = -kv0_out[si]
+            Mb[1, 3::2] = -iv1_out[si]
+            Mb[2, 1:-1:2] = iv0_in[si]
+            Mb[2, 2::2] = kv1_out[si]
+            Mb[3, :-2:2] = kv0_in[si]
+            Mb[3, 1:-1:2] = tmp * iv1_in[si]
+            Mb[4, :-2:2] = -tmp * kv1_in[si]
 
             # set the boundary-conditions if needed
             if R_part[0] > 0.0:
-                Mb[2, 0] = -kv(nu1, Cs[0] * R_part[0])
-                Mb[1, 1] = iv(nu1, Cs[0] * R_part[0])
+                Mb[2, 0] = -kv1_well[si]
+                Mb[1, 1] = iv1_well[si]
             if R_part[-1] < np.inf:
-                Mb[-2, -2] = kv(nu, Cs[-1] * R_part[-1])
-                Mb[2, -1] = iv(nu, Cs[-1] * R_part[-1])
+                Mb[-2, -2] = kv0_bound[si]
+                Mb[2, -1] = iv0_bound[si]
             else:  # erase the last row, since X[-1] will be 0
                 Mb[0, -1] = 0
                 Mb[1, -1] = 0
@@ -281,33 +441,63 @@ def grf_laplace(
                 except np.linalg.LinAlgError:
                     # set 0 if matrix singular
                     X[:2] = 0
-            elif first > 1:
+            elif first == 2:
+                # two active disks give a 4x4 system: the hand-unrolled
+                # solve skips the banded-solver dispatch
+                # (couplings to cut-off disks lie outside the 4x4 band)
+                X[:4] = _solve_4x4(Mb, V[0])
+            elif first > 2:
                 # shrink the matrix
                 M_sgl = Mb[:, : 2 * first]
                 if first < parts:
                     M_sgl[-1, -1] = 0
                     M_sgl[-2, -1] = 0
                     M_sgl[-1, -2] = 0
-                X[: 2 * first] = solve(
-                    M_sgl, V[: 2 * first], is_flat=True, index_row_wise=False
-                )
-            np.nan_to_num(X, copy=False)
+                # shift the column-wise band to the row-wise layout
+                # expected by pentapy's PTRANS-I core to skip the
+                # per-call checking and copying of pentapy.solve
+                M_row = np.zeros_like(M_sgl)
+                M_row[0, :-2] = M_sgl[0, 2:]
+                M_row[1, :-1] = M_sgl[1, 1:]
+                M_row[2] = M_sgl[2]
+                M_row[3, 1:] = M_sgl[3, :-1]
+                M_row[4, 2:] = M_sgl[4, :-2]
+                try:
+                    X[: 2 * first] = penta_solver1(M_row, V[: 2 * first])
+                except ZeroDivisionError:
+                    # set 0 if PTRANS-I hits a zero pivot
+                    X[: 2 * first] = 0
+            # only rewrite the coefficients if a solve went non-finite
+            if not np.isfinite(X).all():
+                np.nan_to_num(X, copy=False)
 
             # calculate the head (ignore small values)
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", RuntimeWarning)
-                k0_sub = X[2 * pos] * kv(nu, Cs[pos] * rad)
-                k0_sub[np.abs(X[2 * pos]) < cut_off_prec] = 0
-                i0_sub = X[2 * pos + 1] * iv(nu, Cs[pos] * rad)
-                i0_sub[np.abs(X[2 * pos + 1]) < cut_off_prec] = 0
-                res[si, :] = rad ** nu * (k0_sub + i0_sub)
+            arg = sqrt_s[si] * difsr_rad
+            k0_sub = np.where(
+                np.abs(X[idx_k]) < cut_off, 0.0, X[idx_k] * kv0(arg)
+            )
+            i0_sub = np.where(
+                np.abs(X[idx_i]) < cut_off, 0.0, X[idx_i] * iv0(arg)
+            )
+            return rad_nu * (k0_sub + i0_sub)
+
+        # iterate over the laplace-variable
+        # (the solves are independent -> use threads for big batches)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            if len(s) < MIN_PARALLEL_SIZE:
+                for si in range(len(s)):
+                    res[si, :] = solve_one(si)
+            else:
+                with ThreadPoolExecutor() as pool:
+                    rows = pool.map(solve_one, range(len(s)))
+                    for si, row in enumerate(rows):
+                        res[si, :] = row
 
     # set problematic values to 0
     # --> the algorithm tends to violate small values,
     #     therefore this approach is suitable
     np.nan_to_num(res, copy=False)
-    # scale to pumpingrate
-    res *= rate / (K_well * sph_surf(dim) * lat_ext ** (3.0 - dim))
 
     return res
 
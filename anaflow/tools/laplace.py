@@ -13,6 +13,7 @@ The following functions are provided
    lap_trans
    stehfest
 """
+from functools import lru_cache
 from math import floor, factorial
 import numpy as np
 from scipy.integrate import quad
@@ -320,10 +321,117 @@ def stehfest(func, time, bound=12, arg_dict=None, **kwargs):
     return res
 
 
+# lookup-table with pre-calculated stehfest-coefficients
+_C_LOOKUP = {
+    2: np.array([2.000000000000000000e00, -2.000000000000000000e00]),
+    4: np.array(
+        [
+            -2.000000000000000000e00,
+            2.600000000000000000e01,
+            -4.800000000000000000e01,
+            2.400000000000000000e01,
+        ]
+    ),
+    6: np.array(
+        [
+            1.000000000000000000e00,
+            -4.900000000000000000e01,
+            3.660000000000000000e02,
+            -8.580000000000000000e02,
+            8.100000000000000000e02,
+            -2.700000000000000000e02,
+        ]
+    ),
+    8: np.array(
+        [
+            -3.333333333333333148e-01,
+            4.833333333333333570e01,
+            -9.060000000000000000e02,
+            5.464666666666666060e03,
+            -1.437666666666666606e04,
+            1.873000000000000000e04,
+            -1.194666666666666606e04,
+            2.986666666666666515e03,
+        ]
+    ),
+    10: np.array(
+        [
+            8.333333333333332871e-02,
+            -3.208333333333333570e01,
+            1.279000000000000000e03,
+            -1.562366666666666606e04,
+            8.424416666666665697e04,
+            -2.369575000000000000e05,
+            3.759116666666666861e05,
+            -3.400716666666666861e05,
+            1.640625000000000000e05,
+            -3.281250000000000000e04,
+        ]
+    ),
+    12: np.array(
+        [
+            -1.666666666666666644e-02,
+            1.601666666666666572e01,
+            -1.247000000000000000e03,
+            2.755433333333333212e04,
+            -2.632808333333333139e05,
+            1.324138699999999953e06,
+            -3.891705533333333209e06,
+            7.053286333333333023e06,
+            -8.005336500000000000e06,
+            5.552830500000000000e06,
+            -2.155507200000000186e06,
+            3.592512000000000116e05,
+        ]
+    ),
+    14: np.array(
+        [
+            2.777777777777777884e-03,
+            -6.402777777777778567e00,
+            9.240499999999999545e02,
+            -3.459792777777777519e04,
+            5.403211111111111240e05,
+            -4.398346366666667163e06,
+            2.108759177777777612e07,
+            -6.394491304444444180e07,
+            1.275975795499999970e08,
+            -1.701371880833333433e08,
+            1.503274670333333313e08,
+            -8.459216150000000000e07,
+            2.747888476666666567e07,
+            -3.925554966666666791e06,
+        ]
+    ),
+    16: np.array(
+        [
+            -3.968253968253968251e-04,
+            2.133730158730158699e00,
+            -5.510166666666666515e02,
+            3.350016111111111240e04,
+            -8.126651111111111240e05,
+            1.007618376666666567e07,
+            -7.324138297777777910e07,
+            3.390596320730158687e08,
+            -1.052539536278571367e09,
+            2.259013328583333492e09,
+            -3.399701984433333397e09,
+            3.582450461699999809e09,
+            -2.591494081366666794e09,
+            1.227049828766666651e09,
+            -3.427345554285714030e08,
+            4.284181942857142538e07,
+        ]
+    ),
+}
+
+
 def c_array(bound=12):
     """
     Array of coefficients for the stehfest-algorithm.
 
+    The coefficients only depend on ``bound`` and are cached,
+    so repeated inversions don't recalculate them.
+
     Parameters
     ----------
     bound : :class:`int`, optional
@@ -334,112 +442,12 @@ def c_array(bound=12):
     :class:`numpy.ndarray`
         Array with all coefficinets needed.
     """
-    c_lookup = {
-        2: np.array([2.000000000000000000e00, -2.000000000000000000e00]),
-        4: np.array(
-            [
-                -2.000000000000000000e00,
-                2.600000000000000000e01,
-                -4.800000000000000000e01,
-                2.400000000000000000e01,
-            ]
-        ),
-        6: np.array(
-            [
-                1.000000000000000000e00,
-                -4.900000000000000000e01,
-                3.660000000000000000e02,
-                -8.580000000000000000e02,
-                8.100000000000000000e02,
-                -2.700000000000000000e02,
-            ]
-        ),
-        8: np.array(
-            [
-                -3.333333333333333148e-01,
-                4.833333333333333570e01,
-                -9.060000000000000000e02,
-                5.464666666666666060e03,
-                -1.437666666666666606e04,
-                1.873000000000000000e04,
-                -1.194666666666666606e04,
-                2.986666666666666515e03,
-            ]
-        ),
-        10: np.array(
-            [
-                8.333333333333332871e-02,
-                -3.208333333333333570e01,
-                1.279000000000000000e03,
-                -1.562366666666666606e04,
-                8.424416666666665697e04,
-                -2.369575000000000000e05,
-                3.759116666666666861e05,
-                -3.400716666666666861e05,
-                1.640625000000000000e05,
-                -3.281250000000000000e04,
-            ]
-        ),
-        12: np.array(
-            [
-                -1.666666666666666644e-02,
-                1.601666666666666572e01,
-                -1.247000000000000000e03,
-                2.755433333333333212e04,
-                -2.632808333333333139e05,
-                1.324138699999999953e06,
-                -3.891705533333333209e06,
-                7.053286333333333023e06,
-                -8.005336500000000000e06,
-                5.552830500000000000e06,
-                -2.155507200000000186e06,
-                3.592512000000000116e05,
-            ]
-        ),
-        14: np.array(
-            [
-                2.777777777777777884e-03,
-                -6.402777777777778567e00,
-                9.240499999999999545e02,
-                -3.459792777777777519e04,
-                5.403211111111111240e05,
-                -4.398346366666667163e06,
-                2.108759177777777612e07,
-                -6.394491304444444180e07,
-                1.275975795499999970e08,
-                -1.701371880833333433e08,
-                1.503274670333333313e08,
-                -8.459216150000000000e07,
-                2.747888476666666567e07,
-                -3.925554966666666791e06,
-            ]
-        ),
-        16: np.array(
-            [
-                -3.968253968253968251e-04,
-                2.133730158730158699e00,
-                -5.510166666666666515e02,
-                3.350016111111111240e04,
-                -8.126651111111111240e05,
-                1.007618376666666567e07,
-                -7.324138297777777910e07,
-                3.390596320730158687e08,
-                -1.052539536278571367e09,
-                2.259013328583333492e09,
-                -3.399701984433333397e09,
-                3.582450461699999809e09,
-                -2.591494081366666794e09,
-                1.227049828766666651e09,
-                -3.427345554285714030e08,
-                4.284181942857142538e07,
-            ]
-        ),
-    }
-    if bound in c_lookup:
-        return c_lookup[bound]
+    if bound in _C_LOOKUP:
+        return _C_LOOKUP[bound]
     return _carr(bound)
 
 
+@lru_cache(maxsize=32)
 def _carr(bound):
     res = np.zeros(bound)
     for i in range(1, bound + 1):
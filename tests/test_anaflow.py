@@ -6,6 +6,7 @@ This is the unittest of AnaFlow.
 import unittest
 import numpy as np
 import anaflow as af
+from anaflow.flow.laplace import grf_laplace
 
 # import matplotlib.pyplot as plt
 
@@ -237,6 +238,25 @@ class TestAnaFlow(unittest.TestCase):
         #     plt.plot(self.rad, rad_arr, dashes=[1, 1])
         # plt.show()
 
+    def test_grf_bounded(self):
+        # single disk with finite outer boundary: the iv-term overflows
+        # for large laplace-points, but the head needs to stay non-zero
+        lap = grf_laplace(
+            [1e3], [0.5], [1e-4], [1e-4], [0.1, 25.0], 2, 1.0, -1e-4
+        )
+        self.assertAlmostEqual(lap[0, 0], -6.4649064e-11, delta=1e-15)
+        # same setup at early times through the laplace-inversion
+        transient = af.ext_grf(
+            self.time * 1e-3,
+            [0.5],
+            [1e-4],
+            [1e-4],
+            [0.1, 25.0],
+            rate=self.rate,
+        )
+        self.assertTrue(np.all(transient < 0.0))
+        self.assertTrue(dec(transient[:, 0]))
+
 
 if __name__ == "__main__":
     unittest.main()